@@ -17,14 +17,39 @@ Author: Netflix EDA Project
 Date: 2024
 """
 
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
 import warnings
 warnings.filterwarnings('ignore')
 
+# pyarrow is optional: when present, string columns are kept in Arrow buffers
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# dtype_backend='pyarrow' exists from pandas 2.0, but Arrow-backed str.extract needs 2.2
+PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+USE_ARROW_BACKEND = HAS_PYARROW and PANDAS_VERSION >= (2, 2)
+
+# The Parquet copy of the dataset needs pyarrow or fastparquet; otherwise the CSV is always used
+try:
+    import fastparquet  # noqa: F401
+    HAS_FASTPARQUET = True
+except ImportError:
+    HAS_FASTPARQUET = False
+HAS_PARQUET_ENGINE = HAS_PYARROW or HAS_FASTPARQUET
+
+# Columns added by _parse_duration for internal use; left out of the cleaning report
+DURATION_HELPER_COLUMNS = ['duration_num', 'is_movie_dur', 'is_tv_dur']
+
+# Copy-on-write lets derived frames share data until a column is modified
+pd.options.mode.copy_on_write = True
+
 # Set style for better-looking plots
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
@@ -32,22 +57,47 @@ sns.set_palette("husl")
 class NetflixEDA:
     """Main class for Netflix Exploratory Data Analysis"""
     
-    def __init__(self, data_path):
+    def __init__(self, data_path, verbose=False):
         """
         Initialize the Netflix EDA class
         
         Args:
             data_path (str): Path to the Netflix dataset CSV file
+            verbose (bool): Print the full column info and summary statistics in explore_data
         """
         self.data_path = data_path
+        self.verbose = verbose
         self.df = None
         self.cleaned_df = None
-        
+        self._reset_cached_results()
+        
+    def _reset_cached_results(self):
+        """Clear analysis results cached from a previous cleaning run"""
+        self._content_counts = None
+        self._release_trends = None
+        self._genre_counts = None
+        self._country_counts = None
+        self._movie_durations = None
+        self._tv_durations = None
+        self._rating_counts = None
+        self._heatmap = None
+    
     def load_data(self):
-        """Load the Netflix dataset"""
+        """Load the Netflix dataset, using a Parquet copy of the CSV when available"""
         try:
             print("Loading Netflix dataset...")
-            self.df = pd.read_csv(self.data_path)
+            parquet_path = os.path.splitext(self.data_path)[0] + '.parquet'
+            self.df = None
+            if HAS_PARQUET_ENGINE and self._parquet_is_fresh(parquet_path):
+                self.df = self._read_parquet(parquet_path)
+            
+            if self.df is None:
+                if USE_ARROW_BACKEND:
+                    self.df = pd.read_csv(self.data_path, engine='pyarrow', dtype_backend='pyarrow')
+                else:
+                    self.df = pd.read_csv(self.data_path)
+                if HAS_PARQUET_ENGINE:
+                    self._write_parquet(parquet_path)
             print(f"Dataset loaded successfully! Shape: {self.df.shape}")
             return True
         except FileNotFoundError:
@@ -58,6 +108,32 @@ class NetflixEDA:
             print(f"Error loading dataset: {e}")
             return False
     
+    def _parquet_is_fresh(self, parquet_path):
+        """Check whether the Parquet copy exists and is not older than the CSV"""
+        if not os.path.exists(parquet_path):
+            return False
+        if not os.path.exists(self.data_path):
+            return True
+        return os.path.getmtime(parquet_path) >= os.path.getmtime(self.data_path)
+    
+    def _read_parquet(self, parquet_path):
+        """Read the Parquet copy, returning None so the caller falls back to the CSV"""
+        try:
+            backend = {'dtype_backend': 'pyarrow'} if USE_ARROW_BACKEND else {}
+            return pd.read_parquet(parquet_path, **backend)
+        except Exception as e:
+            print(f"Could not read Parquet copy of the dataset, using the CSV instead: {e}")
+            return None
+    
+    def _write_parquet(self, parquet_path):
+        """Save the loaded CSV as Parquet so later runs skip CSV parsing"""
+        try:
+            self.df.to_parquet(parquet_path, compression='zstd')
+            print(f"Saved Parquet copy of the dataset to {parquet_path}")
+        except Exception as e:
+            # Later runs fall back to the CSV if the copy is missing or unreadable
+            print(f"Could not save Parquet copy of the dataset: {e}")
+    
     def explore_data(self):
         """Display basic information about the dataset"""
         if self.df is None:
@@ -73,15 +149,17 @@ class NetflixEDA:
         print("\nFirst 5 rows:")
         print(self.df.head())
         
-        print("\nDataset Info:")
-        print(self.df.info())
+        if self.verbose:
+            print("\nDataset Info:")
+            self.df.info()
         
         print("\nMissing values:")
         missing_values = self.df.isnull().sum()
         print(missing_values[missing_values > 0])
         
-        print("\nBasic statistics:")
-        print(self.df.describe())
+        if self.verbose:
+            print("\nBasic statistics:")
+            print(self.df.describe(include=[np.number], percentiles=[]))
     
     def clean_data(self):
         """Clean and preprocess the dataset"""
@@ -93,8 +171,11 @@ class NetflixEDA:
         print("DATA CLEANING")
         print("="*50)
         
-        # Create a copy for cleaning
-        self.cleaned_df = self.df.copy()
+        # Start from a shallow copy; copy-on-write keeps the raw frame untouched
+        self.cleaned_df = self.df.copy(deep=False)
+        
+        # Invalidate analysis results cached from a previous run
+        self._reset_cached_results()
         
         # Handle missing values
         print("Handling missing values...")
@@ -102,19 +183,17 @@ class NetflixEDA:
         # Fill missing dates with forward fill
         if 'date_added' in self.cleaned_df.columns:
             self.cleaned_df['date_added'] = pd.to_datetime(self.cleaned_df['date_added'], errors='coerce')
-            self.cleaned_df['date_added'] = self.cleaned_df['date_added'].fillna(method='ffill')
-        
-        # Fill missing countries with 'Unknown'
-        if 'country' in self.cleaned_df.columns:
-            self.cleaned_df['country'] = self.cleaned_df['country'].fillna('Unknown')
-        
-        # Fill missing ratings with 'Unknown'
-        if 'rating' in self.cleaned_df.columns:
-            self.cleaned_df['rating'] = self.cleaned_df['rating'].fillna('Unknown')
-        
-        # Fill missing durations with median/mode
-        if 'duration' in self.cleaned_df.columns:
-            self.cleaned_df['duration'] = self.cleaned_df['duration'].fillna('Unknown')
+            dates = self.cleaned_df['date_added'].to_numpy()
+            # Index of the last valid date at or before each row (0 for leading NaT rows)
+            last_valid = np.where(~np.isnat(dates), np.arange(len(dates)), 0)
+            np.maximum.accumulate(last_valid, out=last_valid)
+            self.cleaned_df['date_added'] = dates[last_valid]
+        
+        # Fill missing countries, ratings and durations with 'Unknown' in a single pass
+        unknown_fill = {column: 'Unknown' for column in ('country', 'rating', 'duration')
+                        if column in self.cleaned_df.columns}
+        if unknown_fill:
+            self.cleaned_df = self.cleaned_df.fillna(unknown_fill)
         
         # Remove duplicates based on show_id
         initial_count = len(self.cleaned_df)
@@ -122,16 +201,107 @@ class NetflixEDA:
         final_count = len(self.cleaned_df)
         print(f"Removed {initial_count - final_count} duplicate entries")
         
-        # Extract year from date_added for analysis
+        # Extract year and month from date_added for analysis
         if 'date_added' in self.cleaned_df.columns:
-            self.cleaned_df['year_added'] = self.cleaned_df['date_added'].dt.year
+            self.cleaned_df['year_added'] = self.cleaned_df['date_added'].dt.year.astype('Int16')
+            self.cleaned_df['month_added'] = self.cleaned_df['date_added'].dt.month.astype('Int8')
+        
+        # Count releases per year once for the trend analysis and plot
+        if 'release_year' in self.cleaned_df.columns:
+            self._release_trends = self.cleaned_df['release_year'].value_counts().sort_index()
         
-        print(f"Data cleaning completed! Final shape: {self.cleaned_df.shape}")
+        # Parse numeric durations once for the duration analysis
+        if 'duration' in self.cleaned_df.columns:
+            self._parse_duration()
+        
+        # Store low-cardinality text columns as categoricals
+        for column in ('type', 'rating'):
+            if column in self.cleaned_df.columns:
+                self.cleaned_df[column] = self.cleaned_df[column].astype('category')
+        
+        report_df = self.cleaned_df.drop(columns=DURATION_HELPER_COLUMNS, errors='ignore')
+        print(f"Data cleaning completed! Final shape: {report_df.shape}")
         
         # Display missing values after cleaning
         print("\nMissing values after cleaning:")
-        missing_after = self.cleaned_df.isnull().sum()
+        missing_after = report_df.isnull().sum()
         print(missing_after[missing_after > 0])
+        
+        # Release the raw frame; only cleaned_df is used from here on
+        self.df = None
+    
+    def _parse_duration(self):
+        """Extract the numeric part of 'duration' along with its unit"""
+        duration = self.cleaned_df['duration']
+        self.cleaned_df['duration_num'] = duration.str.extract(r'(?P<num>\d+)', expand=False).astype('Int16')
+        self.cleaned_df['is_movie_dur'] = duration.str.contains('min', na=False)
+        self.cleaned_df['is_tv_dur'] = duration.str.contains('Season', na=False)
+    
+    def _duration_arrays(self):
+        """Return movie durations (minutes) and TV show durations (seasons) as arrays"""
+        if self._movie_durations is not None:
+            return self._movie_durations, self._tv_durations
+        
+        parsed = self.cleaned_df['duration_num'].notna()
+        movie_mask = parsed & self.cleaned_df['is_movie_dur'] & (self.cleaned_df['type'] == 'Movie')
+        tv_mask = parsed & self.cleaned_df['is_tv_dur'] & (self.cleaned_df['type'] == 'TV Show')
+        self._movie_durations = self.cleaned_df.loc[movie_mask, 'duration_num'].to_numpy(dtype=np.int64)
+        self._tv_durations = self.cleaned_df.loc[tv_mask, 'duration_num'].to_numpy(dtype=np.int64)
+        return self._movie_durations, self._tv_durations
+    
+    def _year_month_counts(self):
+        """Count titles added per year (rows) and month (columns)"""
+        if self._heatmap is not None:
+            return self._heatmap
+        
+        valid = self.cleaned_df['date_added'].notna()
+        years = self.cleaned_df.loc[valid, 'year_added'].to_numpy(dtype=np.int16)
+        months = self.cleaned_df.loc[valid, 'month_added'].to_numpy(dtype=np.int8)
+        
+        if years.size == 0:
+            self._heatmap = pd.DataFrame(columns=range(1, 13), dtype=np.int32)
+            return self._heatmap
+        
+        year_min, year_max = years.min(), years.max()
+        counts = np.zeros((year_max - year_min + 1, 12), dtype=np.int32)
+        np.add.at(counts, (years - year_min, months - 1), 1)
+        
+        self._heatmap = pd.DataFrame(counts,
+                                     index=pd.RangeIndex(year_min, year_max + 1, name='year_added'),
+                                     columns=pd.RangeIndex(1, 13, name='month_added'))
+        return self._heatmap
+    
+    def _split_counts(self, column):
+        """Count the comma-separated values of a column, most common first"""
+        return (self.cleaned_df[column].dropna()
+                .str.split(',')
+                .explode()
+                .str.strip()
+                .value_counts())
+    
+    def _cached_content_counts(self):
+        """Return the number of titles per content type"""
+        if self._content_counts is None:
+            self._content_counts = self.cleaned_df['type'].value_counts()
+        return self._content_counts
+    
+    def _cached_genre_counts(self):
+        """Return the number of titles per genre, most common first"""
+        if self._genre_counts is None:
+            self._genre_counts = self._split_counts('listed_in')
+        return self._genre_counts
+    
+    def _cached_country_counts(self):
+        """Return the number of titles per country, most common first"""
+        if self._country_counts is None:
+            self._country_counts = self._split_counts('country')
+        return self._country_counts
+    
+    def _cached_rating_counts(self):
+        """Return the number of titles per content rating"""
+        if self._rating_counts is None:
+            self._rating_counts = self.cleaned_df['rating'].value_counts()
+        return self._rating_counts
     
     def analyze_content_types(self):
         """Analyze distribution of Movies vs TV Shows"""
@@ -143,8 +313,8 @@ class NetflixEDA:
         print("CONTENT TYPE ANALYSIS")
         print("="*50)
         
-        content_counts = self.cleaned_df['type'].value_counts()
-        content_percentages = self.cleaned_df['type'].value_counts(normalize=True) * 100
+        content_counts = self._cached_content_counts()
+        content_percentages = content_counts / content_counts.sum() * 100
         
         print("Content Type Distribution:")
         for content_type, count in content_counts.items():
@@ -164,14 +334,14 @@ class NetflixEDA:
         print("="*50)
         
         # Analyze by release year
-        release_trends = self.cleaned_df['release_year'].value_counts().sort_index()
+        release_trends = self._release_trends
         
         print("Top 10 years by number of releases:")
         top_years = release_trends.tail(10)
         for year, count in top_years.items():
             print(f"{year}: {count:,} releases")
         
-        print(f"\nRelease year range: {self.cleaned_df['release_year'].min()} - {self.cleaned_df['release_year'].max()}")
+        print(f"\nRelease year range: {release_trends.index.min()} - {release_trends.index.max()}")
         
         return release_trends
     
@@ -185,20 +355,14 @@ class NetflixEDA:
         print("GENRE ANALYSIS")
         print("="*50)
         
-        # Split genres and count them
-        all_genres = []
-        for genres in self.cleaned_df['listed_in'].dropna():
-            genre_list = [genre.strip() for genre in str(genres).split(',')]
-            all_genres.extend(genre_list)
-        
-        genre_counts = Counter(all_genres)
-        top_genres = genre_counts.most_common(10)
+        # Split genres and count them (reused by create_visualizations)
+        top_genres = self._cached_genre_counts().head(10)
         
         print("Top 10 Most Popular Genres:")
-        for i, (genre, count) in enumerate(top_genres, 1):
+        for i, (genre, count) in enumerate(top_genres.items(), 1):
             print(f"{i:2d}. {genre}: {count:,}")
         
-        return dict(top_genres)
+        return top_genres.to_dict()
     
     def analyze_countries(self):
         """Analyze countries contributing most content"""
@@ -210,20 +374,14 @@ class NetflixEDA:
         print("COUNTRY ANALYSIS")
         print("="*50)
         
-        # Split countries and count them
-        all_countries = []
-        for countries in self.cleaned_df['country'].dropna():
-            country_list = [country.strip() for country in str(countries).split(',')]
-            all_countries.extend(country_list)
-        
-        country_counts = Counter(all_countries)
-        top_countries = country_counts.most_common(15)
+        # Split countries and count them (reused by create_visualizations)
+        top_countries = self._cached_country_counts().head(15)
         
         print("Top 15 Countries by Content Contribution:")
-        for i, (country, count) in enumerate(top_countries, 1):
+        for i, (country, count) in enumerate(top_countries.items(), 1):
             print(f"{i:2d}. {country}: {count:,}")
         
-        return dict(top_countries)
+        return top_countries.to_dict()
     
     def analyze_duration(self):
         """Analyze duration patterns for movies and TV shows"""
@@ -236,37 +394,16 @@ class NetflixEDA:
         print("="*50)
         
         # Separate movies and TV shows
-        movies = self.cleaned_df[self.cleaned_df['type'] == 'Movie']
-        tv_shows = self.cleaned_df[self.cleaned_df['type'] == 'TV Show']
+        movie_durations, tv_durations = self._duration_arrays()
         
         print("MOVIE DURATION ANALYSIS:")
-        movie_durations = []
-        for duration in movies['duration'].dropna():
-            if 'min' in str(duration):
-                try:
-                    duration_min = int(str(duration).split()[0])
-                    movie_durations.append(duration_min)
-                except:
-                    continue
-        
-        if movie_durations:
-            movie_durations = np.array(movie_durations)
+        if movie_durations.size:
             print(f"Average movie duration: {np.mean(movie_durations):.1f} minutes")
             print(f"Median movie duration: {np.median(movie_durations):.1f} minutes")
             print(f"Duration range: {np.min(movie_durations)} - {np.max(movie_durations)} minutes")
         
         print("\nTV SHOW DURATION ANALYSIS:")
-        tv_durations = []
-        for duration in tv_shows['duration'].dropna():
-            if 'Season' in str(duration):
-                try:
-                    seasons = int(str(duration).split()[0])
-                    tv_durations.append(seasons)
-                except:
-                    continue
-        
-        if tv_durations:
-            tv_durations = np.array(tv_durations)
+        if tv_durations.size:
             print(f"Average TV show seasons: {np.mean(tv_durations):.1f}")
             print(f"Median TV show seasons: {np.median(tv_durations):.1f}")
             print(f"Seasons range: {np.min(tv_durations)} - {np.max(tv_durations)}")
@@ -283,8 +420,8 @@ class NetflixEDA:
         print("RATING ANALYSIS")
         print("="*50)
         
-        rating_counts = self.cleaned_df['rating'].value_counts()
-        rating_percentages = self.cleaned_df['rating'].value_counts(normalize=True) * 100
+        rating_counts = self._cached_rating_counts()
+        rating_percentages = rating_counts / rating_counts.sum() * 100
         
         print("Content Rating Distribution:")
         for rating, count in rating_counts.items():
@@ -293,6 +430,16 @@ class NetflixEDA:
         
         return rating_counts
     
+    def _prepare_visualization_data(self):
+        """Compute any aggregated results the plots need that are not cached yet"""
+        self._cached_content_counts()
+        self._cached_genre_counts()
+        self._cached_country_counts()
+        self._cached_rating_counts()
+        self._duration_arrays()
+        if 'date_added' in self.cleaned_df.columns:
+            self._year_month_counts()
+    
     def create_visualizations(self):
         """Create comprehensive visualizations"""
         if self.cleaned_df is None:
@@ -303,13 +450,17 @@ class NetflixEDA:
         print("CREATING VISUALIZATIONS")
         print("="*50)
         
+        # All heavy lifting happens here; the plots below only draw cached results
+        self._prepare_visualization_data()
+        
         # Set up the plotting style
         plt.rcParams['figure.figsize'] = (12, 8)
         plt.rcParams['font.size'] = 10
+        plt.rcParams['savefig.dpi'] = 150
         
         # 1. Content Type Distribution
         plt.figure(figsize=(10, 6))
-        content_counts = self.cleaned_df['type'].value_counts()
+        content_counts = self._content_counts
         plt.subplot(2, 2, 1)
         content_counts.plot(kind='bar', color=['#e74c3c', '#3498db'])
         plt.title('Movies vs TV Shows Distribution', fontsize=14, fontweight='bold')
@@ -323,8 +474,7 @@ class NetflixEDA:
         
         # 2. Release Trends Over Years
         plt.subplot(2, 2, 2)
-        release_trends = self.cleaned_df['release_year'].value_counts().sort_index()
-        recent_years = release_trends.tail(20)  # Last 20 years
+        recent_years = self._release_trends.tail(20)  # Last 20 years
         plt.plot(recent_years.index, recent_years.values, marker='o', linewidth=2, markersize=6)
         plt.title('Content Releases Over Years (Last 20 Years)', fontsize=14, fontweight='bold')
         plt.xlabel('Year')
@@ -333,16 +483,10 @@ class NetflixEDA:
         
         # 3. Top Genres
         plt.subplot(2, 2, 3)
-        all_genres = []
-        for genres in self.cleaned_df['listed_in'].dropna():
-            genre_list = [genre.strip() for genre in str(genres).split(',')]
-            all_genres.extend(genre_list)
-        
-        genre_counts = Counter(all_genres)
-        top_genres = dict(genre_counts.most_common(10))
+        top_genres = self._genre_counts.head(10)
         
-        genres = list(top_genres.keys())
-        counts = list(top_genres.values())
+        genres = list(top_genres.index)
+        counts = list(top_genres.values)
         
         plt.barh(range(len(genres)), counts, color='lightcoral')
         plt.yticks(range(len(genres)), genres)
@@ -351,16 +495,10 @@ class NetflixEDA:
         
         # 4. Top Countries
         plt.subplot(2, 2, 4)
-        all_countries = []
-        for countries in self.cleaned_df['country'].dropna():
-            country_list = [country.strip() for country in str(countries).split(',')]
-            all_countries.extend(country_list)
+        top_countries = self._country_counts.head(10)
         
-        country_counts = Counter(all_countries)
-        top_countries = dict(country_counts.most_common(10))
-        
-        countries = list(top_countries.keys())
-        counts = list(top_countries.values())
+        countries = list(top_countries.index)
+        counts = list(top_countries.values)
         
         plt.barh(range(len(countries)), counts, color='lightblue')
         plt.yticks(range(len(countries)), countries)
@@ -368,86 +506,71 @@ class NetflixEDA:
         plt.xlabel('Count')
         
         plt.tight_layout()
-        plt.savefig('netflix_analysis_overview.png', dpi=300, bbox_inches='tight')
+        # The release-trend title is wider than its subplot, so this figure still needs a tight bbox
+        plt.savefig('netflix_analysis_overview.png', bbox_inches='tight')
         plt.show()
         
         # 5. Duration Analysis
         plt.figure(figsize=(15, 5))
         
+        movie_durations, tv_durations = self._movie_durations, self._tv_durations
+        
         # Movie Duration Distribution
         plt.subplot(1, 3, 1)
-        movies = self.cleaned_df[self.cleaned_df['type'] == 'Movie']
-        movie_durations = []
-        for duration in movies['duration'].dropna():
-            if 'min' in str(duration):
-                try:
-                    duration_min = int(str(duration).split()[0])
-                    movie_durations.append(duration_min)
-                except:
-                    continue
-        
-        if movie_durations:
-            plt.hist(movie_durations, bins=30, color='skyblue', alpha=0.7, edgecolor='black')
+        if movie_durations.size:
+            hist, edges = np.histogram(movie_durations, bins=30)
+            plt.bar(edges[:-1], hist, width=np.diff(edges), align='edge',
+                    color='skyblue', alpha=0.7, edgecolor='black')
             plt.title('Movie Duration Distribution', fontsize=14, fontweight='bold')
             plt.xlabel('Duration (minutes)')
             plt.ylabel('Frequency')
-            plt.axvline(np.mean(movie_durations), color='red', linestyle='--', 
-                       label=f'Mean: {np.mean(movie_durations):.1f} min')
+            movie_mean = movie_durations.mean()
+            plt.axvline(movie_mean, color='red', linestyle='--', 
+                       label=f'Mean: {movie_mean:.1f} min')
             plt.legend()
         
         # TV Show Seasons Distribution
         plt.subplot(1, 3, 2)
-        tv_shows = self.cleaned_df[self.cleaned_df['type'] == 'TV Show']
-        tv_durations = []
-        for duration in tv_shows['duration'].dropna():
-            if 'Season' in str(duration):
-                try:
-                    seasons = int(str(duration).split()[0])
-                    tv_durations.append(seasons)
-                except:
-                    continue
-        
-        if tv_durations:
-            plt.hist(tv_durations, bins=20, color='lightgreen', alpha=0.7, edgecolor='black')
+        if tv_durations.size:
+            hist, edges = np.histogram(tv_durations, bins=20)
+            plt.bar(edges[:-1], hist, width=np.diff(edges), align='edge',
+                    color='lightgreen', alpha=0.7, edgecolor='black')
             plt.title('TV Show Seasons Distribution', fontsize=14, fontweight='bold')
             plt.xlabel('Number of Seasons')
             plt.ylabel('Frequency')
-            plt.axvline(np.mean(tv_durations), color='red', linestyle='--', 
-                       label=f'Mean: {np.mean(tv_durations):.1f} seasons')
+            tv_mean = tv_durations.mean()
+            plt.axvline(tv_mean, color='red', linestyle='--', 
+                       label=f'Mean: {tv_mean:.1f} seasons')
             plt.legend()
         
         # Rating Distribution
         plt.subplot(1, 3, 3)
-        rating_counts = self.cleaned_df['rating'].value_counts()
+        rating_counts = self._rating_counts
         plt.pie(rating_counts.values, labels=rating_counts.index, autopct='%1.1f%%', startangle=90)
         plt.title('Content Rating Distribution', fontsize=14, fontweight='bold')
         
         plt.tight_layout()
-        plt.savefig('netflix_duration_ratings.png', dpi=300, bbox_inches='tight')
+        plt.savefig('netflix_duration_ratings.png')
         plt.show()
         
         # 6. Heatmap: Releases by Year and Month
         plt.figure(figsize=(12, 8))
         
-        # Extract month from date_added
-        if 'date_added' in self.cleaned_df.columns:
-            self.cleaned_df['month_added'] = self.cleaned_df['date_added'].dt.month
-            self.cleaned_df['year_added'] = self.cleaned_df['date_added'].dt.year
-            
-            # Create pivot table for heatmap
-            heatmap_data = self.cleaned_df.groupby(['year_added', 'month_added']).size().unstack(fill_value=0)
-            
+        if self._heatmap is not None:
             # Only show recent years for better visualization
-            recent_years = heatmap_data.tail(10)
+            recent_years = self._heatmap.tail(10)
             
             plt.subplot(2, 1, 1)
-            sns.heatmap(recent_years, annot=True, fmt='d', cmap='YlOrRd', cbar_kws={'label': 'Number of Releases'})
+            # Hand seaborn a contiguous int32 array so annotations need no upcasting
+            sns.heatmap(np.ascontiguousarray(recent_years.to_numpy(dtype=np.int32)),
+                        xticklabels=recent_years.columns, yticklabels=recent_years.index,
+                        annot=True, fmt='d', cmap='YlOrRd', cbar_kws={'label': 'Number of Releases'})
             plt.title('Netflix Releases Heatmap (Year vs Month)', fontsize=14, fontweight='bold')
             plt.xlabel('Month')
             plt.ylabel('Year')
         
         plt.tight_layout()
-        plt.savefig('netflix_heatmap.png', dpi=300, bbox_inches='tight')
+        plt.savefig('netflix_heatmap.png')
         plt.show()
         
         print("All visualizations saved as PNG files!")